@@ -1,9 +1,22 @@
 # core/config_manager.py
 import logging
-from core.db_manager import save_user_config, get_user_config, delete_user_config, list_user_configs
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from core.db_manager import (
+    save_user_config,
+    get_user_config,
+    get_user_configs,
+    delete_user_config,
+    list_user_configs,
+)
 
 logger = logging.getLogger(__name__)
 
+# Tiempo (segundos) que un valor leído de BD se reutiliza sin volver a consultarla
+CONFIG_CACHE_TTL = 300
+
 
 class ConfigManager:
     """
@@ -33,6 +46,10 @@ class ConfigManager:
             "reddit_api_key",
         ]
 
+        # Caché en memoria (user_id, config_key) -> (instante, valor)
+        self._cache: Dict[Tuple[int, str], Tuple[float, str]] = {}
+        self._cache_lock = threading.Lock()
+
     def save_config(
         self,
         user_id: int,
@@ -53,20 +70,72 @@ class ConfigManager:
                 logger.warning("Guardando configuración sin valores.")
                 return False
             saved = save_user_config(user_id, config_key, config_value, encrypt_if_sensitive)
+            if saved:
+                self.invalidate(user_id, config_key)
             return saved
         except Exception as e:
             logger.error(f"Error guardando configuración: {e}")
             return False
 
-    def get_config(self, user_id: int, config_key: str) -> str:
+    def get_config(self, user_id: int, config_key: str, cached: bool = False) -> str:
         """
         Obtiene valor de configuración almacenada.
         :param user_id: ID del usuario
         :param config_key: Clave a buscar
+        :param cached: Reutiliza el valor leído hace menos de CONFIG_CACHE_TTL.
+            Solo para claves API de búsqueda; nunca para tokens de acceso
+            (otro proceso puede revocarlos sin invalidar esta caché).
         :return: El valor (string) o "" si no existe.
         """
-        value = get_user_config(user_id, config_key)
-        return value or ""
+        if not cached:
+            return get_user_config(user_id, config_key) or ""
+
+        cache_key = (user_id, config_key)
+        now = time.monotonic()
+
+        with self._cache_lock:
+            hit = self._cache.get(cache_key)
+        if hit and now - hit[0] <= CONFIG_CACHE_TTL:
+            return hit[1]
+
+        value = get_user_config(user_id, config_key) or ""
+        if value:
+            # Los "no existe" no se cachean: una clave recién guardada se ve al momento
+            with self._cache_lock:
+                self._cache[cache_key] = (now, value)
+        return value
+
+    def get_configs(self, user_id: int, config_keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Obtiene varias claves API de una vez (una sola consulta a BD para
+        las que no estén en caché). Usa la misma caché que
+        get_config(..., cached=True): no usar para tokens de acceso.
+        :param user_id: ID del usuario
+        :param config_keys: Claves a buscar
+        :return: Diccionario clave -> valor ("" si no existe).
+        """
+        now = time.monotonic()
+        values: Dict[str, str] = {}
+        missing = []
+
+        with self._cache_lock:
+            for config_key in config_keys:
+                hit = self._cache.get((user_id, config_key))
+                if hit and now - hit[0] <= CONFIG_CACHE_TTL:
+                    values[config_key] = hit[1]
+                else:
+                    missing.append(config_key)
+
+        if missing:
+            found = get_user_configs(user_id, missing)
+            with self._cache_lock:
+                for config_key in missing:
+                    value = found.get(config_key) or ""
+                    if value:
+                        self._cache[(user_id, config_key)] = (now, value)
+                    values[config_key] = value
+
+        return values
 
     def delete_config(self, user_id: int, config_key: str) -> bool:
         """
@@ -75,7 +144,23 @@ class ConfigManager:
         :param config_key: Clave a eliminar
         :return: Booleano indicando éxito.
         """
-        return delete_user_config(user_id, config_key)
+        deleted = delete_user_config(user_id, config_key)
+        self.invalidate(user_id, config_key)
+        return deleted
+
+    def invalidate(self, user_id: int, config_key: Optional[str] = None) -> None:
+        """
+        Descarta valores cacheados del usuario (todos o solo una clave).
+        Útil tras rotar claves desde fuera de este gestor.
+        :param user_id: ID del usuario
+        :param config_key: Clave concreta o None para todas las del usuario
+        """
+        with self._cache_lock:
+            if config_key is not None:
+                self._cache.pop((user_id, config_key), None)
+                return
+            for key in [k for k in self._cache if k[0] == user_id]:
+                del self._cache[key]
 
     def list_configs(self, user_id: int) -> list:
         """
@@ -398,6 +398,29 @@ def get_user_config(user_id: int, config_key: str, db_path: str = 'data/users.db
         return None
 
 
+def get_user_configs(user_id: int, config_keys: list, db_path: str = 'data/users.db') -> dict:
+    """
+    Obtiene varias configuraciones de un usuario en una sola consulta.
+    Devuelve {config_key: valor} solo con las claves existentes.
+    """
+    if not config_keys:
+        return {}
+    try:
+        conn = sqlite3.connect(db_path)
+        c = conn.cursor()
+        placeholders = ",".join("?" * len(config_keys))
+        c.execute(
+            f"SELECT config_key, config_value FROM user_configs WHERE user_id=? AND config_key IN ({placeholders})",
+            (user_id, *config_keys)
+        )
+        results = c.fetchall()
+        conn.close()
+        return {r[0]: r[1] for r in results}
+    except Exception as e:
+        logger.error(f"Error obteniendo configuraciones para usuario {user_id}: {e}")
+        return {}
+
+
 def delete_user_config(user_id: int, config_key: str, db_path: str = 'data/users.db') -> bool:
     """
     Elimina una configuración específica de un usuario.
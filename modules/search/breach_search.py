@@ -14,13 +14,46 @@ from typing import Any, Dict, List, Tuple, Callable
 from urllib.parse import quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson (opcional) evita decodificar bytes -> str antes de parsear
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
-TIMEOUT = 12
+TIMEOUT = (5, 12)  # (connect, read): un host caído se detecta en 5 s
 MAX_RESULTS = 25
 MAX_WORKERS = 5  # ajustable si añades más proveedores
 
+# Sesión compartida por todos los proveedores: reutiliza conexiones TCP/TLS
+# entre búsquedas en lugar de abrir una nueva por cada requests.get
+session = requests.Session()
+session.headers.update({"User-Agent": "QuasarIII-Breach/1.0"})
+_adapter = HTTPAdapter(
+    pool_connections=MAX_WORKERS,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=1,
+        connect=1,
+        # Ni lecturas ni 5xx/429 se reintentan (tampoco se duerme lo que diga
+        # Retry-After): un proveedor lento no debe multiplicar el TIMEOUT
+        read=0,
+        status=0,
+        backoff_factor=0.3,
+        respect_retry_after_header=False,
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    ),
+)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
 
 # ---------------------------------------------------------------------------
 # API pública
@@ -146,7 +179,7 @@ def search_breaches(
 
 def _safe_json(response: requests.Response) -> Any:
     try:
-        return response.json()
+        return _json_loads(response.content)
     except Exception:
         return None
 
@@ -206,7 +239,7 @@ def _search_haveibeenransom(query: str) -> Tuple[List[Dict[str, Any]], str]:
     manual_url = f"https://haveibeenransom.com/?search={quote_plus(query)}"
 
     try:
-        r = requests.get(api_url, params={"query": query}, timeout=TIMEOUT)
+        r = session.get(api_url, params={"query": query}, timeout=TIMEOUT)
         logger.debug("[breach:haveibeenransom] http=%s", r.status_code)
 
         if r.status_code == 200:
@@ -247,7 +280,7 @@ def _search_antipublic(query: str) -> Tuple[List[Dict[str, Any]], str]:
     manual_url = f"{api_url}?q={quote_plus(query)}"
 
     try:
-        r = requests.get(api_url, params={"q": query}, timeout=TIMEOUT)
+        r = session.get(api_url, params={"q": query}, timeout=TIMEOUT)
         logger.debug("[breach:antipublic] http=%s", r.status_code)
 
         if r.status_code == 200:
@@ -281,7 +314,7 @@ def _search_based_re(query: str) -> Tuple[List[Dict[str, Any]], str]:
     manual_url = f"{api_url}?q={quote_plus(query)}"
 
     try:
-        r = requests.get(api_url, params={"q": query}, timeout=TIMEOUT)
+        r = session.get(api_url, params={"q": query}, timeout=TIMEOUT)
         logger.debug("[breach:based.re] http=%s", r.status_code)
 
         if r.status_code == 200:
@@ -315,7 +348,7 @@ def _search_scattered_secrets(query: str) -> Tuple[List[Dict[str, Any]], str]:
     manual_url = f"{api_url}?q={quote_plus(query)}"
 
     try:
-        r = requests.get(api_url, params={"q": query}, timeout=TIMEOUT)
+        r = session.get(api_url, params={"q": query}, timeout=TIMEOUT)
         logger.debug("[breach:scatteredsecrets] http=%s", r.status_code)
 
         if r.status_code == 200:
@@ -348,7 +381,7 @@ def _search_psbdmp(query: str) -> Tuple[List[Dict[str, Any]], str]:
     url = f"https://psbdmp.ws/api/v3/search/{query}"
 
     try:
-        r = requests.get(url, timeout=TIMEOUT)
+        r = session.get(url, timeout=TIMEOUT)
         logger.debug("[breach:psbdmp] http=%s", r.status_code)
 
         if r.status_code == 200:
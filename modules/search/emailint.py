@@ -13,16 +13,21 @@ NO incluye:
 
 import re
 import time
+import atexit
+import copy
+import hashlib
+import asyncio
 import logging
 import urllib.parse
 import os
 import sys
 import shutil
 import subprocess
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from requests import Session
-import io
-import contextlib
 
 from core.config_manager import config_manager
 
@@ -33,8 +38,12 @@ logger = logging.getLogger(__name__)
 # --------------------------------------------------
 
 EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[A-Za-z]{2,}$")
+_EMAIL_MATCH = EMAIL_RE.match
+EMAIL_MAX_LEN = 254  # RFC 5321: longitud máxima de una dirección
 TIMEOUT = 25
 
+_GMAIL_DOMAINS = frozenset({"gmail.com", "googlemail.com"})
+
 session = Session()
 session.headers.update({
     "User-Agent": "QuasarIII-EmailInt/1.0",
@@ -50,6 +59,10 @@ GHUNT_IMPORT_ERROR = None
 GHUNT_WARNINGS: List[str] = []
 
 try:
+    import io
+    import contextlib
+    import contextvars
+
     from ghunt.modules.email import hunt as ghunt_hunt  # type: ignore
     import ghunt.helpers.gmaps as ghunt_gmaps  # type: ignore
 
@@ -89,6 +102,41 @@ try:
 
     ghunt_gmaps.get_reviews = _safe_get_reviews  # type: ignore[assignment]
 
+    # Buffer único para capturar la salida de GHunt (se reutiliza bajo _ghunt_lock)
+    _GHUNT_STDOUT_BUF = io.StringIO()
+
+    # Destino de la salida de la tarea GHunt en curso (None = stdout normal)
+    _ghunt_capture: "contextvars.ContextVar[Optional[io.StringIO]]" = contextvars.ContextVar(
+        "ghunt_capture", default=None
+    )
+
+    class _StdoutProxy:
+        """
+        sys.stdout de larga duración: lo que escribe una tarea de GHunt va a
+        su buffer (ContextVar) y el resto al stdout original. Sustituye al
+        redirect_stdout por llamada, cuyo guardar/restaurar anidado se
+        corrompía si una tarea cancelada terminaba después de la siguiente.
+        """
+
+        def __init__(self, wrapped):
+            self._wrapped = wrapped
+
+        def write(self, text):
+            target = _ghunt_capture.get()
+            return (self._wrapped if target is None else target).write(text)
+
+        def flush(self):
+            target = _ghunt_capture.get()
+            (self._wrapped if target is None else target).flush()
+
+        def __getattr__(self, name):
+            return getattr(self._wrapped, name)
+
+    def _install_stdout_proxy() -> None:
+        # Sin stdout (pythonw, algunos demonios) print() ya descarta la salida
+        if sys.stdout is not None and not isinstance(sys.stdout, _StdoutProxy):
+            sys.stdout = _StdoutProxy(sys.stdout)
+
     GHUNT_AVAILABLE = True
     logger.info("GHunt cargado correctamente")
 except Exception as e:
@@ -96,17 +144,92 @@ except Exception as e:
     GHUNT_IMPORT_ERROR = str(e)
     logger.debug("GHunt no disponible: %s", GHUNT_IMPORT_ERROR)
 
+# --------------------------------------------------
+# CACHÉ EN MEMORIA (TTL)
+# --------------------------------------------------
+
+# TTL (segundos) por fuente; solo se cachean resultados correctos
+CACHE_TTLS: Dict[str, int] = {
+    "ghunt": 6 * 60 * 60,  # perfil Google: cambia poco, 6 horas
+    "hashtray": 60 * 60,  # 1 hora
+    "hashtray_not_found": 24 * 60 * 60,  # "not found" cambia poco: 24 horas
+}
+CACHE_MAX_ENTRIES = 4096
+
+_cache_lock = threading.Lock()
+_hashtray_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_ghunt_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _normalize_email(email: str) -> str:
+    return (email or "").strip().lower()
+
+
+def _cache_key(email_norm: str) -> str:
+    """Clave de caché: hash del email normalizado (no se guarda PII en claro)."""
+    return hashlib.blake2b(email_norm.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_get(cache: Dict[str, Tuple[float, Dict[str, Any]]], key: str) -> Optional[Dict[str, Any]]:
+    with _cache_lock:
+        hit = cache.get(key)
+        if not hit:
+            return None
+        expires_at, payload = hit
+        if time.monotonic() > expires_at:
+            cache.pop(key, None)
+            return None
+    # Copia profunda: el llamador puede modificar el resultado sin tocar la caché
+    return copy.deepcopy(payload)
+
+
+def _cache_set(cache: Dict[str, Tuple[float, Dict[str, Any]]], key: str, payload: Dict[str, Any], ttl: int) -> None:
+    # Se guarda una copia: el dict devuelto al llamador no comparte listas con la caché
+    stored = copy.deepcopy(payload)
+    with _cache_lock:
+        cache.pop(key, None)
+        if len(cache) >= CACHE_MAX_ENTRIES:
+            # Expulsa la entrada más antigua (orden de inserción)
+            cache.pop(next(iter(cache)), None)
+        cache[key] = (time.monotonic() + ttl, stored)
+
+
+def clear_cache() -> None:
+    """Vacía la caché en memoria de lookups de email (útil en tests)."""
+    with _cache_lock:
+        _hashtray_cache.clear()
+        _ghunt_cache.clear()
+
+
 # --------------------------------------------------
 # HELPERS
 # --------------------------------------------------
 
 
 def verify_email_format(email: str) -> bool:
-    return isinstance(email, str) and bool(EMAIL_RE.match(email.strip()))
+    if not email or not isinstance(email, str):
+        return False
+    email = email.strip()
+    # Entradas sin '@' o desmesuradas se rechazan sin pasar por el motor de regex
+    if "@" not in email or len(email) > EMAIL_MAX_LEN:
+        return False
+    return _EMAIL_MATCH(email) is not None
+
+
+# En un email válido (EMAIL_RE) solo '@', '+' y '%' necesitan escaparse
+_EMAIL_URL_QUOTE = str.maketrans({"@": "%40", "+": "%2B", "%": "%25"})
+
+
+def _quote_email(email: str) -> str:
+    """Equivalente a quote_plus para emails válidos, sin su bucle en Python."""
+    # fullmatch: con match, '$' también acepta un '\n' final que quedaría sin escapar
+    if EMAIL_RE.fullmatch(email):
+        return email.translate(_EMAIL_URL_QUOTE)
+    return urllib.parse.quote_plus(email)
 
 
 def _build_source_link(email: str, source_name: str, base_url: str = "") -> Dict[str, Any]:
-    encoded_email = urllib.parse.quote_plus(email)
+    encoded_email = _quote_email(email)
     url = base_url or f"https://www.google.com/search?q={encoded_email}+{urllib.parse.quote_plus(source_name)}"
     return {
         "name": source_name,
@@ -116,16 +239,23 @@ def _build_source_link(email: str, source_name: str, base_url: str = "") -> Dict
     }
 
 
-def build_email_source_links(email: str) -> Dict[str, List[Dict[str, Any]]]:
+@lru_cache(maxsize=1024)
+def _gravatar_check_url(email_norm: str) -> str:
+    return f"https://en.gravatar.com/site/check/{_quote_email(email_norm)}"
+
+
+def build_email_source_links(email: str, email_norm: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
     """
     Enlaces listos para búsqueda manual en fuentes OSINT de correo.
     No ejecuta llamadas activas: solo devuelve URLs/comandos para UI.
+    `email_norm` permite reutilizar el email ya normalizado por el llamador.
     """
+    email_norm = email_norm if email_norm is not None else email.strip().lower()
     info_sources = [
         {
             "name": "Gravatar (manual)",
             "source": "gravatar",
-            "url": f"https://en.gravatar.com/site/check/{urllib.parse.quote_plus(email.strip().lower())}",
+            "url": _gravatar_check_url(email_norm),
             "confidence": "media",
             "type": "pivot",
             "email": email,
@@ -145,34 +275,217 @@ def build_email_source_links(email: str) -> Dict[str, List[Dict[str, Any]]]:
 # --------------------------------------------------
 
 
-def ghunt_lookup(email: str) -> Dict[str, Any]:
-    if not GHUNT_AVAILABLE:
-        return {"source": "ghunt", "success": False, "error": GHUNT_IMPORT_ERROR}
+GHUNT_TIMEOUT = TIMEOUT * 2
+GHUNT_CANCEL_GRACE = 5  # espera máxima (s) a que una ejecución cancelada termine
+
+# Respuestas fijas de GHunt (se devuelven copias, nunca el propio dict)
+_GHUNT_UNAVAILABLE = {"source": "ghunt", "success": False, "error": GHUNT_IMPORT_ERROR}
+_GHUNT_CIRCUIT_OPEN = {"source": "ghunt", "success": False, "error": "circuit_open"}
+_GHUNT_TIMED_OUT = {"source": "ghunt", "success": False, "error": "timeout"}
+_GHUNT_NON_GMAIL = {"source": "ghunt", "skipped": "non_gmail"}
+# Mensaje de exit() con el que GHunt indica que la cuenta no existe
+_GHUNT_NOT_FOUND_MARK = "wasn't found"
+
+
+class _GHuntExit(Exception):
+    """GHunt terminó con exit()/Ctrl+C; se traduce en un resultado normal."""
+
+# uvloop (opcional): loop en C para GHunt; solo afecta a este loop, no a la política global
+try:
+    import uvloop  # type: ignore
 
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+_ghunt_loop: Optional[asyncio.AbstractEventLoop] = None
+_ghunt_thread: Optional[threading.Thread] = None
+_ghunt_loop_lock = threading.Lock()
+# GHUNT_WARNINGS es global: una ejecución de GHunt a la vez
+_ghunt_lock = threading.Lock()
+
+
+class _CircuitBreaker:
+    """
+    Tras `fail_threshold` fallos consecutivos deja de llamar al servicio
+    durante `reset_after` segundos; pasado ese tiempo deja pasar un único
+    intento de prueba (si falla, se vuelve a abrir).
+    """
+
+    def __init__(self, fail_threshold: int = 3, reset_after: float = 120.0):
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        """Consulta sin efectos: True si ahora mismo se rechazaría la llamada."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if time.monotonic() - self._opened_at < self.reset_after:
+                return True
+            return self._probing
+
+    def allow(self) -> bool:
+        """Reserva la llamada; en semiabierto solo la obtiene un llamador."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_after or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.fail_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+# Un GHunt caído costaría GHUNT_TIMEOUT por email: se corta tras 3 fallos seguidos
+# (timeouts o errores; una respuesta como "no encontrada" no cuenta)
+_ghunt_breaker = _CircuitBreaker()
+
+
+def _run_ghunt_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
     try:
-        import asyncio
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+def _get_ghunt_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop persistente en un hilo daemon (arranque perezoso).
+    Evita crear/destruir un loop por cada email y permite a GHunt
+    reutilizar sus conexiones entre llamadas.
+    """
+    global _ghunt_loop, _ghunt_thread
+
+    with _ghunt_loop_lock:
+        if _ghunt_loop is None or _ghunt_loop.is_closed():
+            loop = _new_event_loop()
+            # Python >= 3.12: las corrutinas que terminan sin suspenderse no pasan por el scheduler
+            if hasattr(asyncio, "eager_task_factory"):
+                loop.set_task_factory(asyncio.eager_task_factory)
+            thread = threading.Thread(target=_run_ghunt_loop, args=(loop,), name="ghunt-loop", daemon=True)
+            thread.start()
+            _ghunt_loop, _ghunt_thread = loop, thread
+        return _ghunt_loop
+
+
+@atexit.register
+def _shutdown_ghunt_loop() -> None:
+    """Detiene y cierra el loop de GHunt al salir del proceso."""
+    with _ghunt_loop_lock:
+        loop, thread = _ghunt_loop, _ghunt_thread
+    if loop is None or loop.is_closed():
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=2)
+
+
+def ghunt_lookup(email: str, email_norm: Optional[str] = None, cache_key: Optional[str] = None) -> Dict[str, Any]:
+    global _GHUNT_STDOUT_BUF
+
+    if not GHUNT_AVAILABLE:
+        return dict(_GHUNT_UNAVAILABLE)
 
-        GHUNT_WARNINGS.clear()
-        buffer = io.StringIO()
+    key = cache_key or _cache_key(email_norm if email_norm is not None else _normalize_email(email))
+    cached = _cache_get(_ghunt_cache, key)
+    if cached is not None:
+        return {**cached, "cached": True}
 
-        async def _run():
-            with contextlib.redirect_stdout(buffer):
-                return await ghunt_hunt(None, email)
+    if _ghunt_breaker.is_open():
+        return dict(_GHUNT_CIRCUIT_OPEN)
 
-        raw = asyncio.run(_run())
-        output = buffer.getvalue().strip()
-        buffer.close()
+    try:
+        # La espera en cola detrás de otras ejecuciones también se acota
+        if not _ghunt_lock.acquire(timeout=GHUNT_TIMEOUT):
+            return dict(_GHUNT_TIMED_OUT)
+        try:
+            # Se vuelve a comprobar con el lock: mientras se esperaba, las
+            # ejecuciones anteriores pueden haber abierto el circuito
+            if not _ghunt_breaker.allow():
+                return dict(_GHUNT_CIRCUIT_OPEN)
+
+            GHUNT_WARNINGS.clear()
+            buffer = _GHUNT_STDOUT_BUF
+            buffer.seek(0)
+            buffer.truncate(0)
+
+            _install_stdout_proxy()
+            finished = threading.Event()
+
+            async def _run():
+                # La ContextVar es propia de esta tarea: nada que restaurar fuera
+                _ghunt_capture.set(buffer)
+                try:
+                    return await ghunt_hunt(None, email)
+                except (SystemExit, KeyboardInterrupt) as exc:
+                    # GHunt llama a exit() (p. ej. cuenta no encontrada): si el
+                    # BaseException llegase al loop mataría el hilo ghunt-loop
+                    raise _GHuntExit(str(exc) or type(exc).__name__) from None
+                finally:
+                    finished.set()
+
+            future = asyncio.run_coroutine_threadsafe(_run(), _get_ghunt_loop())
+            try:
+                raw = future.result(timeout=GHUNT_TIMEOUT)
+            except FuturesTimeoutError:
+                future.cancel()
+                # No se suelta el lock hasta que la tarea cancelada termine
+                # (acotado): así no escribe en GHUNT_WARNINGS de la siguiente
+                if not finished.wait(GHUNT_CANCEL_GRACE):
+                    logger.warning("GHunt: la tarea cancelada no ha terminado en %ss", GHUNT_CANCEL_GRACE)
+                # Si sigue viva puede escribir aún: se le deja su buffer
+                _GHUNT_STDOUT_BUF = io.StringIO()
+                _ghunt_breaker.record_failure()
+                return dict(_GHUNT_TIMED_OUT)
+            except _GHuntExit as exc:
+                message = str(exc)
+                output = "\n".join(filter(None, (buffer.getvalue().strip(), message)))
+                # GHunt ha respondido (p. ej. "no encontrada"): no es una caída
+                _ghunt_breaker.record_success()
+                return {
+                    "source": "ghunt",
+                    "success": False,
+                    "error": "not_found" if _GHUNT_NOT_FOUND_MARK in message else message,
+                    "output": output,
+                }
+
+            output = buffer.getvalue().strip()
+            warnings = list(GHUNT_WARNINGS)
+        finally:
+            _ghunt_lock.release()
 
-        return {
+        result = {
             "source": "ghunt",
             "success": True,
             "data": raw,
             "output": output,
-            "warnings": list(GHUNT_WARNINGS),
+            "warnings": warnings,
         }
+        _ghunt_breaker.record_success()
+        _cache_set(_ghunt_cache, key, result, CACHE_TTLS["ghunt"])
+        return result
 
     except Exception as e:
         logger.exception("GHunt error")
+        _ghunt_breaker.record_failure()
         return {"source": "ghunt", "success": False, "error": str(e)}
 
 
@@ -180,42 +493,123 @@ def ghunt_lookup(email: str) -> Dict[str, Any]:
 # HASHTRAY (CLI)
 # --------------------------------------------------
 
+_hashtray_cli: Optional[str] = None
+
+
 def _resolve_hashtray_cli() -> Optional[str]:
     """
     Devuelve ruta al binario `hashtray` si existe.
+    Solo se guarda una ruta encontrada: si falta se vuelve a buscar en cada
+    llamada, así una instalación posterior se detecta sin reiniciar.
     """
+    global _hashtray_cli
+
+    if _hashtray_cli is not None:
+        return _hashtray_cli
+
     path_bin = shutil.which("hashtray")
+    if not path_bin:
+        # fallback típico venv
+        venv_bin = os.path.join(sys.prefix, "bin", "hashtray")
+        if os.path.isfile(venv_bin) and os.access(venv_bin, os.X_OK):
+            path_bin = venv_bin
+
     if path_bin:
-        return path_bin
+        _hashtray_cli = path_bin
+    return path_bin
 
-    # fallback típico venv
-    venv_bin = os.path.join(sys.prefix, "bin", "hashtray")
-    if os.path.isfile(venv_bin) and os.access(venv_bin, os.X_OK):
-        return venv_bin
 
-    return None
+_install_lock = threading.Lock()
+_install_result: Optional[Dict[str, Any]] = None
+_hashtray_missing_warned = False
 
 
 def _install_hashtray() -> Dict[str, Any]:
     """
     Intenta instalar hashtray vía pip.
     IMPORTANTE: No forzamos downgrades/changes de deps por conflictos (ej. lxml/maigret).
+    Solo se intenta una vez por proceso: los siguientes intentos devuelven el
+    resultado cacheado en lugar de relanzar pip en el camino de la petición.
     """
-    cmd = [sys.executable, "-m", "pip", "install", "hashtray"]
-    proc = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=240,
-        check=False,
-    )
-    return {
-        "command": " ".join(cmd),
-        "returncode": proc.returncode,
-        "stdout": (proc.stdout or "").strip(),
-        "stderr": (proc.stderr or "").strip(),
-        "success": proc.returncode == 0,
-    }
+    global _install_result
+
+    with _install_lock:
+        if _install_result is not None:
+            return {**_install_result, "skipped": "already_attempted"}
+
+        cmd = [sys.executable, "-m", "pip", "install", "hashtray"]
+        try:
+            proc = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=240,
+                check=False,
+            )
+            _install_result = {
+                "command": " ".join(cmd),
+                "returncode": proc.returncode,
+                "stdout": (proc.stdout or "").strip(),
+                "stderr": (proc.stderr or "").strip(),
+                "success": proc.returncode == 0,
+            }
+        except subprocess.TimeoutExpired:
+            _install_result = {
+                "command": " ".join(cmd),
+                "returncode": None,
+                "stdout": "",
+                "stderr": "timeout",
+                "success": False,
+            }
+
+        return _install_result
+
+
+HASHTRAY_MAX_OUTPUT = 64 * 1024  # bytes leídos como máximo por stream
+
+
+def _run_cli_bounded(cmd: List[str], timeout: int) -> Tuple[int, str, str]:
+    """
+    Ejecuta `cmd` leyendo de las tuberías como máximo HASHTRAY_MAX_OUTPUT
+    bytes por stream. Si el hijo supera ese límite se le mata (returncode
+    negativo): ni la memoria ni el disco crecen con un proceso muy ruidoso.
+    Lanza subprocess.TimeoutExpired si no termina en `timeout` segundos.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    buffers = (bytearray(), bytearray())
+
+    def _drain(stream, buf: bytearray) -> None:
+        # Cada lector cierra su tubería al salir: si un nieto la hereda y el
+        # lector sigue bloqueado, nadie cierra el fd mientras aún lo lee
+        with stream:
+            fd = stream.fileno()
+            while len(buf) < HASHTRAY_MAX_OUTPUT:
+                chunk = os.read(fd, HASHTRAY_MAX_OUTPUT - len(buf))
+                if not chunk:
+                    return
+                buf.extend(chunk)
+            # Límite alcanzado: no hace falta más salida
+            proc.kill()
+
+    readers = [
+        threading.Thread(target=_drain, args=(stream, buf), daemon=True)
+        for stream, buf in zip((proc.stdout, proc.stderr), buffers)
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join(timeout=1)
+
+    stdout, stderr = (bytes(buf).decode("utf-8", errors="replace") for buf in buffers)
+    return proc.returncode, stdout, stderr
 
 
 def _hashtray_found_from_output(stdout: str, stderr: str) -> Optional[bool]:
@@ -228,20 +622,34 @@ def _hashtray_found_from_output(stdout: str, stderr: str) -> Optional[bool]:
     text = f"{stdout or ''}\n{stderr or ''}".lower()
     if "gravatar profile not found" in text and "404" in text:
         return False
-    if "https://gravatar.com/avatar/" in text or "gravatar.com/avatar/" in text:
+    if "gravatar.com/avatar/" in text:
         return True
     if "account hash" in text or "primary email" in text:
         return True
     return None
 
 
-def hashtray_email(email: str, auto_install: bool = True) -> Dict[str, Any]:
+def hashtray_email(
+    email: str,
+    auto_install: bool = True,
+    email_norm: Optional[str] = None,
+    cache_key: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Ejecuta: hashtray email <email>
     Devuelve stdout/stderr + heurística found.
+    Los resultados correctos se cachean por email (los "not found" durante
+    más tiempo: CACHE_TTLS["hashtray_not_found"]).
+    `email_norm` / `cache_key` permiten reutilizar el email ya normalizado
+    (y su clave de caché) calculados por el llamador.
     """
     start = time.time()
 
+    key = cache_key or _cache_key(email_norm if email_norm is not None else _normalize_email(email))
+    cached = _cache_get(_hashtray_cache, key)
+    if cached is not None:
+        return {**cached, "cached": True}
+
     result: Dict[str, Any] = {
         "source": "hashtray",
         "email": email,
@@ -272,6 +680,10 @@ def hashtray_email(email: str, auto_install: bool = True) -> Dict[str, Any]:
         cli = _resolve_hashtray_cli()
 
     if not cli:
+        global _hashtray_missing_warned
+        if not auto_install and not _hashtray_missing_warned:
+            logger.warning("hashtray no disponible: instala la dependencia con 'pip install hashtray'")
+            _hashtray_missing_warned = True
         result["error"] = "hashtray_not_available"
         result["elapsed"] = round(time.time() - start, 3)
         return result
@@ -283,21 +695,15 @@ def hashtray_email(email: str, auto_install: bool = True) -> Dict[str, Any]:
     result["command"] = " ".join(cmd)
 
     try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=180,
-            check=False,
-        )
-        stdout = (proc.stdout or "").strip()
-        stderr = (proc.stderr or "").strip()
+        returncode, stdout, stderr = _run_cli_bounded(cmd, timeout=180)
+        stdout = stdout.strip()
+        stderr = stderr.strip()
 
         result.update({
             "stdout": stdout,
             "stderr": stderr,
-            "returncode": proc.returncode,
-            "success": proc.returncode == 0,
+            "returncode": returncode,
+            "success": returncode == 0,
             "found": _hashtray_found_from_output(stdout, stderr),
         })
 
@@ -312,6 +718,12 @@ def hashtray_email(email: str, auto_install: bool = True) -> Dict[str, Any]:
         result["error"] = str(exc)
 
     result["elapsed"] = round(time.time() - start, 3)
+
+    # Solo se cachean ejecuciones completas (no timeouts ni errores de CLI)
+    if result["returncode"] == 0 and not result["error"]:
+        ttl = CACHE_TTLS["hashtray_not_found" if result["found"] is False else "hashtray"]
+        _cache_set(_hashtray_cache, key, result, ttl)
+
     return result
 
 
@@ -320,8 +732,8 @@ def hashtray_email(email: str, auto_install: bool = True) -> Dict[str, Any]:
 # --------------------------------------------------
 
 
-def verify_deliverability(email: str) -> Dict[str, Any]:
-    if not verify_email_format(email):
+def verify_deliverability(email: str, validated: bool = False) -> Dict[str, Any]:
+    if not validated and not verify_email_format(email):
         return {"source": "verification", "email": email, "deliverable": False, "reason": "invalid_format"}
 
     return {"source": "verification", "email": email, "deliverable": "unknown"}
@@ -352,21 +764,52 @@ def search_email_info(email: str, user_id: int = 1) -> Dict[str, Any]:
 
     try:
         email = (email or "").strip()
-
-        # ---------------- GHUNT ----------------
-        if email.lower().endswith(("@gmail.com", "@googlemail.com")):
-            out["ghunt"] = ghunt_lookup(email)
-        else:
-            out["ghunt"] = {"source": "ghunt", "skipped": "non_gmail"}
-
-        # ---------------- HASHTRAY ----------------
-        out["hashtray"] = hashtray_email(email, auto_install=True)
-
-        # ---------------- VERIFICATION ----------------
-        out["verification"] = verify_deliverability(email)
-
-        # ---------------- ENLACES OSINT ----------------
-        out["sources"] = build_email_source_links(email)
+        email_norm = email.lower()
+        email_domain = email_norm.partition("@")[2]
+
+        # Formato inválido: se responde sin lanzar ningún lookup
+        if not verify_email_format(email):
+            out["verification"] = verify_deliverability(email)
+            out["errors"].append("invalid_format")
+            out["search_time"] = round(time.time() - start, 3)
+            return out
+
+        # Clave de caché común a GHunt y hashtray: se calcula una sola vez
+        cache_key = _cache_key(email_norm)
+
+        # GHunt y hashtray son I/O (red / subproceso): se lanzan en paralelo
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # ---------------- GHUNT ----------------
+            if email_domain in _GMAIL_DOMAINS:
+                f_ghunt = executor.submit(ghunt_lookup, email, cache_key=cache_key)
+            else:
+                f_ghunt = None
+                out["ghunt"] = dict(_GHUNT_NON_GMAIL)
+
+            # ---------------- HASHTRAY ----------------
+            f_hashtray = executor.submit(hashtray_email, email, auto_install=False, cache_key=cache_key)
+
+            # ---------------- VERIFICATION ----------------
+            out["verification"] = verify_deliverability(email, validated=True)
+
+            # ---------------- ENLACES OSINT ----------------
+            out["sources"] = build_email_source_links(email, email_norm=email_norm)
+
+            # Cada future se protege por separado: un fallo no tumba el resto
+            if f_ghunt is not None:
+                try:
+                    out["ghunt"] = f_ghunt.result()
+                except Exception as e:
+                    logger.exception("GHunt future error")
+                    out["ghunt"] = {"source": "ghunt", "success": False, "error": str(e)}
+                    out["errors"].append(f"ghunt: {e}")
+
+            try:
+                out["hashtray"] = f_hashtray.result()
+            except Exception as e:
+                logger.exception("hashtray future error")
+                out["hashtray"] = {"source": "hashtray", "email": email, "success": False, "error": str(e)}
+                out["errors"].append(f"hashtray: {e}")
 
     except Exception as e:
         logger.exception("Email intelligence error")
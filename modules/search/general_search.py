@@ -8,14 +8,14 @@ General Search — OSINT Pasivo y Controlado
 """
 
 import logging
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
 
-import requests
-
 from core.config_manager import config_manager
 
 logger = logging.getLogger(__name__)
@@ -25,27 +25,54 @@ logger = logging.getLogger(__name__)
 # CONFIGURACIÓN GLOBAL
 # ============================================================
 
-PASSIVE_SOURCES = {
+PASSIVE_SOURCES = frozenset({
     "web_search",
     "google_search",
     "bing_search",
     "duckduckgo_search",
-}
+})
 
-ACTIVE_OPTIONAL_SOURCES = {
+ACTIVE_OPTIONAL_SOURCES = frozenset({
     "serpapi",
     "openai",
     "predictasearch",
-}
+})
 
-FORBIDDEN_SOURCES = {
+FORBIDDEN_SOURCES = frozenset({
     "hibp",
     "hunter",
     "shodan",
     "virustotal",
     "whoisxml",
+})
+
+# Estado fijo de una fuente pasiva en get_user_sources (se copia por llamada)
+_PASSIVE_SOURCE_INFO = MappingProxyType({"enabled": True, "requires_api": False})
+
+# URL de búsqueda general por motor ({q} = consulta ya codificada)
+_ENGINE_URL_TEMPLATES = {
+    "web": "https://www.google.com/search?q={q}",
+    "google": "https://www.google.com/search?q={q}",
+    "bing": "https://www.bing.com/search?q={q}",
+    "duckduckgo": "https://duckduckgo.com/?q={q}",
+}
+
+# Parte fija del resultado de cada motor; por llamada solo cambian url/snippet/timestamp
+_ENGINE_RESULT_BASE = {
+    engine: {
+        "title": f"Panorama general ({engine})",
+        "confidence": 0.65,
+        "source": engine,
+    }
+    for engine in _ENGINE_URL_TEMPLATES
 }
 
+_WEB_SNIPPET = (
+    "Vista inicial de resultados públicos sobre '{context}'. "
+    "Para dorks y consultas especializadas se utiliza el módulo "
+    "de búsqueda avanzada (google_dorks)."
+)
+
 
 @dataclass(frozen=True)
 class SourceProfile:
@@ -67,12 +94,13 @@ class GeneralSearcher:
     """
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "QuasarIII-GeneralSearch/1.0"
-        })
-        self.timeout = 20
+        self.timeout = 20  # presupuesto total (s) de una búsqueda, no por fuente
         self.max_workers = 4
+        # Pool compartido entre búsquedas (los hilos se crean bajo demanda)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="general-search",
+        )
 
         self.source_catalog: Dict[str, SourceProfile] = {
             "web_search": SourceProfile("web_search", "passive", "web"),
@@ -91,18 +119,29 @@ class GeneralSearcher:
     def get_user_sources(self, user_id: int) -> Dict[str, Dict]:
         """Devuelve catálogo de fuentes y si el usuario tiene claves listas."""
 
+        # Todas las claves API en una sola lectura de configuración
+        api_keys = config_manager.get_configs(user_id, [
+            p.api_key_name
+            for p in self.source_catalog.values()
+            if p.requires_api and p.api_key_name and p.name not in FORBIDDEN_SOURCES
+        ])
+
         sources: Dict[str, Dict[str, Any]] = {}
         for name, profile in self.source_catalog.items():
             if profile.name in FORBIDDEN_SOURCES:
                 continue
 
+            if profile.mode == "passive" and not profile.requires_api:
+                sources[name] = dict(_PASSIVE_SOURCE_INFO)
+                continue
+
             info: Dict[str, Any] = {
                 "enabled": profile.mode == "passive",
                 "requires_api": profile.requires_api,
             }
 
             if profile.requires_api and profile.api_key_name:
-                api_key = config_manager.get_config(user_id, profile.api_key_name)
+                api_key = api_keys.get(profile.api_key_name)
                 info["has_api_key"] = bool(api_key)
                 info["enabled"] = bool(api_key)
 
@@ -122,7 +161,7 @@ class GeneralSearcher:
         max_results: int = 10
     ) -> Dict[str, Any]:
 
-        start = time.time()
+        start = time.monotonic()
         clean_query = (query or "").strip()
         logger.info("[GeneralSearch] query='%s' mode=%s", clean_query, mode)
 
@@ -136,7 +175,7 @@ class GeneralSearcher:
                 "total_results": 0,
                 "errors": ["query_empty"],
                 "skipped_sources": [],
-                "search_time": round(time.time() - start, 3),
+                "search_time": round(time.monotonic() - start, 3),
             }
 
         selected_sources, skipped = self._resolve_sources(clean_query, sources, mode, user_id)
@@ -154,30 +193,62 @@ class GeneralSearcher:
         }
 
         if not selected_sources:
-            results["search_time"] = round(time.time() - start, 3)
+            results["search_time"] = round(time.monotonic() - start, 3)
             return results
 
-        with ThreadPoolExecutor(max_workers=min(len(selected_sources), self.max_workers)) as executor:
-            futures = [
-                executor.submit(self._search_single_source, clean_query, src)
-                for src in selected_sources
-            ]
+        # La consulta se codifica una vez y se comparte entre motores
+        quoted_query = quote_plus(clean_query)
+
+        # Una sola fuente: se ejecuta en el propio hilo, sin pasar por el pool
+        if len(selected_sources) == 1:
+            src = selected_sources[0]
+            try:
+                data = self._search_single_source(clean_query, src, quoted_query)
+                self._store_source_data(results, src, data, max_results)
+            except Exception as e:
+                logger.error("Error en fuente %s: %s", src, e)
+                results["errors"].append(f"{src}: {str(e)}")
+            results["search_time"] = round(time.monotonic() - start, 3)
+            return results
+
+        # Cada future se retira al consumirlo: no se retienen resultados ya copiados
+        pending = {
+            self._executor.submit(self._search_single_source, clean_query, src, quoted_query): src
+            for src in selected_sources
+        }
 
-            for src, future in zip(selected_sources, futures):
+        # Se procesan según terminan; ninguna fuente alarga la búsqueda
+        # más allá del presupuesto total
+        try:
+            for future in as_completed(pending, timeout=self.timeout):
+                src = pending.pop(future)
                 try:
-                    data = future.result(timeout=self.timeout)
-                    if data:
-                        # Guardamos solo hasta max_results por fuente
-                        sliced = data[:max_results]
-                        results["raw_results"][src] = sliced
-                        results["total_results"] += len(sliced)
+                    self._store_source_data(results, src, future.result(), max_results)
                 except Exception as e:
                     logger.error("Error en fuente %s: %s", src, e)
                     results["errors"].append(f"{src}: {str(e)}")
+        except FuturesTimeoutError:
+            for future, src in pending.items():
+                future.cancel()
+                logger.warning("Fuente %s fuera de plazo", src)
+                results["errors"].append(f"{src}: deadline_exceeded")
 
-        results["search_time"] = round(time.time() - start, 3)
+        results["search_time"] = round(time.monotonic() - start, 3)
         return results
 
+    @staticmethod
+    def _store_source_data(
+        results: Dict[str, Any],
+        src: str,
+        data: List[Dict[str, Any]],
+        max_results: int,
+    ) -> None:
+        if data:
+            # Guardamos solo hasta max_results por fuente (sin copiar si ya cabe)
+            sliced = data if len(data) <= max_results else data[:max_results]
+            results["raw_results"][src] = sliced
+            results["total_results"] += len(sliced)
+
     def _resolve_sources(
         self,
         query: str,
@@ -189,14 +260,17 @@ class GeneralSearcher:
         Filtra y normaliza fuentes solicitadas devolviendo seleccionadas y omitidas.
         """
 
-        requested = sources or list(PASSIVE_SOURCES)
+        requested = sources or PASSIVE_SOURCES
+        passive_only = mode == "passive"
         normalized: List[str] = []
         skipped: List[Dict[str, Any]] = []
+        seen = set()
 
         for src in requested:
-            name = (src or "").strip().lower()
-            if not name or name in normalized:
+            name = src.strip().lower() if src else ""
+            if not name or name in seen:
                 continue
+            seen.add(name)
 
             if name in FORBIDDEN_SOURCES:
                 skipped.append({"source": name, "reason": "forbidden"})
@@ -207,12 +281,12 @@ class GeneralSearcher:
                 skipped.append({"source": name, "reason": "unknown_source"})
                 continue
 
-            if mode == "passive" and profile.mode != "passive":
+            if passive_only and profile.mode != "passive":
                 skipped.append({"source": name, "reason": "restricted_by_mode"})
                 continue
 
             if profile.requires_api:
-                api_key = config_manager.get_config(user_id, profile.api_key_name)
+                api_key = config_manager.get_config(user_id, profile.api_key_name, cached=True)
                 if not api_key:
                     skipped.append({"source": name, "reason": "missing_api_key"})
                     continue
@@ -228,58 +302,37 @@ class GeneralSearcher:
     # --------------------------------------------------------
     # BÚSQUEDA POR FUENTE (PASIVA)
     # --------------------------------------------------------
-    def _search_single_source(self, query: str, source: str) -> List[Dict[str, Any]]:
-        if source == "web_search":
-            return self._search_web(query, "web")
-
-        if source == "google_search":
-            return self._search_web(query, "google")
-
-        if source == "bing_search":
-            return self._search_web(query, "bing")
-
-        if source == "duckduckgo_search":
-            return self._search_web(query, "duckduckgo")
+    def _search_single_source(self, query: str, source: str, quoted_query: Optional[str] = None) -> List[Dict[str, Any]]:
+        # El catálogo ya indica el motor de cada fuente: una búsqueda O(1)
+        profile = self.source_catalog.get(source)
+        if profile is None or profile.mode != "passive":
+            return []
 
-        return []
+        return self._search_web(query, profile.engine, quoted_query)
 
     # --------------------------------------------------------
     # SIMULACIÓN CONTROLADA DE BÚSQUEDA WEB
     # (sin solaparse con las búsquedas de google_dorks)
     # --------------------------------------------------------
-    def _search_web(self, query: str, engine: str) -> List[Dict[str, Any]]:
+    def _search_web(self, query: str, engine: str, quoted_query: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Genera únicamente una búsqueda general por motor.
         Cualquier dork avanzado (comillas, modificadores, etc.) se delega
         al módulo google_dorks para evitar solapamiento.
         """
-        url_map = {
-            "web": f"https://www.google.com/search?q={quote_plus(query)}",
-            "google": f"https://www.google.com/search?q={quote_plus(query)}",
-            "bing": f"https://www.bing.com/search?q={quote_plus(query)}",
-            "duckduckgo": f"https://duckduckgo.com/?q={quote_plus(query)}",
-        }
-
-        base_url = url_map.get(engine)
-        timestamp = time.time()
-        context = query[:180]
-
-        if not base_url:
+        url_template = _ENGINE_URL_TEMPLATES.get(engine)
+        if not url_template:
             return []
 
+        if quoted_query is None:
+            quoted_query = quote_plus(query)
         # 🔹 SOLO UN RESULTADO POR MOTOR, genérico
         return [
             {
-                "title": f"Panorama general ({engine})",
-                "url": base_url,
-                "snippet": (
-                    f"Vista inicial de resultados públicos sobre '{context}'. "
-                    "Para dorks y consultas especializadas se utiliza el módulo "
-                    "de búsqueda avanzada (google_dorks)."
-                ),
-                "confidence": 0.65,
-                "source": engine,
-                "timestamp": timestamp,
+                **_ENGINE_RESULT_BASE[engine],
+                "url": url_template.format(q=quoted_query),
+                "snippet": _WEB_SNIPPET.format(context=query[:180]),
+                "timestamp": time.time(),
             }
         ]
 
@@ -288,7 +341,26 @@ class GeneralSearcher:
 # API PÚBLICA DEL MÓDULO
 # ============================================================
 
-general_searcher = GeneralSearcher()
+_general_searcher: Optional[GeneralSearcher] = None
+_general_searcher_lock = threading.Lock()
+
+
+def _get_general_searcher() -> GeneralSearcher:
+    """Instancia única, creada en el primer uso (importar el módulo no la construye)."""
+    global _general_searcher
+
+    if _general_searcher is None:
+        with _general_searcher_lock:
+            if _general_searcher is None:
+                _general_searcher = GeneralSearcher()
+    return _general_searcher
+
+
+def __getattr__(name: str) -> Any:
+    # Compat: `general_search.general_searcher` sigue disponible (perezoso)
+    if name == "general_searcher":
+        return _get_general_searcher()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def search_general_real(
@@ -298,7 +370,7 @@ def search_general_real(
     mode: str = "passive",
     max_results: int = 10
 ) -> Dict[str, Any]:
-    return general_searcher.search_general_real(
+    return _get_general_searcher().search_general_real(
         query=query,
         user_id=user_id,
         sources=sources,
@@ -308,4 +380,4 @@ def search_general_real(
 
 
 def get_available_sources(user_id: int) -> List[str]:
-    return list(general_searcher.get_user_sources(user_id).keys())
+    return list(_get_general_searcher().get_user_sources(user_id).keys())
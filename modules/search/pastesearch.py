@@ -14,21 +14,53 @@ Fuentes:
 
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import re
+import threading
 from typing import List, Dict, Any
 from urllib.parse import quote_plus
 
 from core.config_manager import config_manager
 
+# orjson (opcional) parsea directamente los bytes de la respuesta; las
+# respuestas de HIBP con cientos de brechas pueden rondar los 100 KB
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 HIBP_BASE_URL = "https://haveibeenpwned.com/api/v3/breachedaccount"
 
 EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
-TIMEOUT = 10
+TIMEOUT = (5, 10)  # (connect, read)
 MAX_RESULTS = 10
 
+# Sesión compartida (keep-alive): HIBP y GitHub reutilizan TCP/TLS
+session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        # 429 no se reintenta: el ritmo lo marca el llamador
+        status_forcelist=(502, 503, 504),
+        respect_retry_after_header=False,
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    ),
+)
+session.mount("https://", _adapter)
+# HIBP sin reintentos: cada intento debe pasar por _TokenBucket
+# (requests usa el prefijo montado más largo)
+session.mount("https://haveibeenpwned.com/", HTTPAdapter(max_retries=0))
+
 
 # ---------------------------------------------------------
 # ENTRY POINT (MANUAL)
@@ -62,11 +94,56 @@ def search_pastes(query: str, user_id: int) -> List[Dict[str, Any]]:
 # HIBP
 # ---------------------------------------------------------
 
+# HIBP limita a 1 petición / 1.5 s por API key: se espacian en cliente
+# para no gastar un RTT en un 429 (ni arriesgar un bloqueo temporal)
+HIBP_RATE = 1 / 1.6  # peticiones por segundo
+HIBP_RATE_WAIT = 5  # espera máxima (s) por un hueco antes de desistir
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float) -> bool:
+        """Reserva un token; espera como mucho `timeout` segundos."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if wait > timeout:
+                return False
+            self._tokens -= 1
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+_hibp_buckets: Dict[str, _TokenBucket] = {}
+_hibp_buckets_lock = threading.Lock()
+
+
+def _hibp_bucket(api_key: str) -> _TokenBucket:
+    with _hibp_buckets_lock:
+        bucket = _hibp_buckets.get(api_key)
+        if bucket is None:
+            bucket = _hibp_buckets[api_key] = _TokenBucket(HIBP_RATE)
+        return bucket
+
+
 def _search_hibp(email: str, user_id: int) -> List[Dict[str, Any]]:
-    hibp_key = config_manager.get_config(user_id, "hibp")
+    hibp_key = config_manager.get_config(user_id, "hibp", cached=True)
     if not hibp_key:
         return []
 
+    if not _hibp_bucket(hibp_key).acquire(timeout=HIBP_RATE_WAIT):
+        logger.warning("HIBP: límite de peticiones local alcanzado, se omite la consulta")
+        return []
+
     headers = {
         "x-apikey": hibp_key,
         "User-Agent": "QuasarIII-PasteSearch/1.0"
@@ -74,10 +151,10 @@ def _search_hibp(email: str, user_id: int) -> List[Dict[str, Any]]:
 
     try:
         url = f"{HIBP_BASE_URL}/{quote_plus(email.lower())}"
-        r = requests.get(url, headers=headers, timeout=TIMEOUT)
+        r = session.get(url, headers=headers, timeout=TIMEOUT)
 
         if r.status_code == 200:
-            data = r.json()
+            data = _json_loads(r.content)
             return [{
                 "title": breach.get("Name"),
                 "date": breach.get("Date"),
@@ -103,7 +180,7 @@ def _search_github_gist(query: str) -> List[Dict[str, Any]]:
         headers = {"User-Agent": "QuasarIII/1.0"}
         params = {"q": query, "per_page": 5}
 
-        r = requests.get(
+        r = session.get(
             "https://api.github.com/search/gists",
             headers=headers,
             params=params,
@@ -111,7 +188,7 @@ def _search_github_gist(query: str) -> List[Dict[str, Any]]:
         )
 
         if r.status_code == 200:
-            data = r.json().get("items", [])
+            data = _json_loads(r.content).get("items", [])
             for gist in data:
                 results.append({
                     "title": gist.get("description") or "GitHub Gist",